@@ -1,35 +1,53 @@
 #!/usr/bin/env python3
 """Concatenate LinkML schema components into a complete schema."""
 
+import re
+import shutil
 import sys
+import textwrap
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Whitespace-only lines, emptied so they stay blank rather than keeping stray indent
+BLANK_LINE_RE = re.compile(r'^[^\S\n]+$', re.MULTILINE)
+
 output = sys.argv[1] if len(sys.argv) > 1 else 'entire_schema.yml'
 
-with open(output, 'w') as out:
-    # Schema metadata
-    out.write(Path('other_elements/schema_metadata.yml').read_text())
-    out.write('\n')
-    
-    # Enums
-    out.write(Path('other_elements/enums.yml').read_text())
-    out.write('\n')
-    
-    # Classes
-    out.write(Path('other_elements/classes.yml').read_text())
-    out.write('\n')
-    
+# Metadata, enums and classes are copied verbatim; only slots need indenting
+verbatim_files = (
+    'other_elements/schema_metadata.yml',
+    'other_elements/enums.yml',
+    'other_elements/classes.yml',
+)
+
+with open(output, 'wb') as out:
+    for src in verbatim_files:
+        with open(src, 'rb') as f:
+            shutil.copyfileobj(f, out, 1 << 20)
+        out.write(b'\n')
+
     # Slots
-    out.write('################################################################################\n')
-    out.write('# SLOTS - FIELD DEFINITIONS\n')
-    out.write('# Here is where we describe the column names from MOB data and conceptually\n')
-    out.write('# map them to DwC\n')
-    out.write('################################################################################\n')
-    out.write('\n')
-    out.write('slots:\n')
-    for slot_file in sorted(Path('slots').glob('*.yaml')):
-        for line in slot_file.read_text().splitlines():
-            out.write(f'  {line}\n' if line.strip() else '\n')
-        out.write('\n')  # blank line between slots
+    parts = []
+    parts.append('################################################################################\n')
+    parts.append('# SLOTS - FIELD DEFINITIONS\n')
+    parts.append('# Here is where we describe the column names from MOB data and conceptually\n')
+    parts.append('# map them to DwC\n')
+    parts.append('################################################################################\n')
+    parts.append('\n')
+    parts.append('slots:\n')
+    # Read slot files concurrently to overlap filesystem latency; the output
+    # itself is still assembled in sorted order
+    slot_files = sorted(Path('slots').glob('*.yaml'))
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        slot_texts = list(executor.map(Path.read_text, slot_files))
+    for text in slot_texts:
+        if text and not text.endswith('\n'):
+            text += '\n'
+        text = BLANK_LINE_RE.sub('', text)
+        # Indent non-blank lines under the top-level slots key
+        parts.append(textwrap.indent(text, '  '))
+        parts.append('\n')  # blank line between slots
+
+    out.write(''.join(parts).encode())
 
 print(f'Schema written to {output}')
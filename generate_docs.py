@@ -1,5 +1,63 @@
-from linkml_runtime import SchemaView
+import io
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+# linkml_runtime is slow to import; only pay for it when a schema is loaded
+if TYPE_CHECKING:
+    from linkml_runtime import SchemaView
+
+# Whitespace runs (including newlines) collapsed inside table cells
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Sentinel for optional attributes, so a present-but-None value is kept as-is
+_MISSING = object()
+
+
+@lru_cache(maxsize=4)
+def _cached_schema_view(schema_path: str, mtime: float) -> "SchemaView":
+    """Load a SchemaView for a local file, keyed on its path and mtime."""
+    from linkml_runtime import SchemaView
+    
+    return SchemaView(schema_path)
+
+
+def _load_schema_view(schema) -> "SchemaView":
+    """
+    Load a SchemaView, reusing it until the schema file changes on disk.
+    
+    Only existing local files are cached. URLs and SchemaDefinition objects are
+    loaded fresh on every call. The cache key is the top-level file's mtime
+    only, so edits to imported schema files are not picked up until the
+    top-level file changes or the process restarts.
+    """
+    if isinstance(schema, (str, os.PathLike)) and os.path.isfile(schema):
+        return _cached_schema_view(os.fspath(schema), os.path.getmtime(schema))
+    
+    from linkml_runtime import SchemaView
+    
+    return SchemaView(schema)
+
+
+_WRITE_FLAGS = (
+    os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+    | getattr(os, 'O_CLOEXEC', 0) | getattr(os, 'O_BINARY', 0)
+)
+
+
+def _dump(path: Path, text: str):
+    """Write generated text as UTF-8 through a raw fd, skipping buffered file objects."""
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, _WRITE_FLAGS, 0o644)
+    try:
+        # os.write may write less than requested
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
 
 
 def generate_filtered_docs(
@@ -11,29 +69,35 @@ def generate_filtered_docs(
     Generate documentation with filtered navigation.
     
     Args:
-        schema_path: Path to your LinkML schema
+        schema_path: Path to your LinkML schema (a URL or SchemaDefinition also works)
         output_dir: Output directory for markdown files
         slots_only: If True, only generate slot pages (data dictionary style)
     """
-    sv = SchemaView(schema_path)
+    sv = _load_schema_view(schema_path)
     local_schema_id = sv.schema.id
     
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
+    # Walk the schema once per element kind; everything below reuses these
+    all_slots = sv.all_slots()
+    all_classes = sv.all_classes()
+    all_enums = sv.all_enums()
+    all_types = sv.all_types()
+    
     # Get local elements only
     local_slots = {
-        name: slot for name, slot in sv.all_slots().items()
+        name: slot for name, slot in all_slots.items()
         if getattr(slot, 'from_schema', local_schema_id) == local_schema_id
     }
     
     local_classes = {
-        name: cls for name, cls in sv.all_classes().items()
+        name: cls for name, cls in all_classes.items()
         if getattr(cls, 'from_schema', local_schema_id) == local_schema_id
     }
     
     local_enums = {
-        name: enum for name, enum in sv.all_enums().items()
+        name: enum for name, enum in all_enums.items()
         if getattr(enum, 'from_schema', local_schema_id) == local_schema_id
     }
     
@@ -41,21 +105,54 @@ def generate_filtered_docs(
     print(f"Found {len(local_classes)} local classes")
     print(f"Found {len(local_enums)} local enums")
     
+    # Sorted once and shared by the index, nav and page renderers
+    sorted_slot_names = case_insensitive_sort(local_slots)
+    sorted_class_names = case_insensitive_sort(local_classes)
+    sorted_enum_names = case_insensitive_sort(local_enums)
+    
+    # Map each range name to (kind, type uri) for one-lookup range resolution.
+    # Later updates win, giving the same enum > class > type precedence as before.
+    range_kind = {
+        name: ("type", getattr(type_def, 'uri', None))
+        for name, type_def in all_types.items()
+    }
+    range_kind.update((name, ("class", None)) for name in all_classes)
+    range_kind.update((name, ("enum", None)) for name in all_enums)
+    
+    # Reverse index of slot -> classes using it, built once for all slot pages.
+    # Uses the same direct + slot_usage slot list as the class attribute tables.
+    slot_to_classes = {}
+    for cname, cls in all_classes.items():
+        for sname in _class_slot_names(sv, cname, cls):
+            slot_to_classes.setdefault(sname, []).append(cname)
+    slot_to_classes = {
+        sname: case_insensitive_sort(cnames)
+        for sname, cnames in slot_to_classes.items()
+    }
+    
     # Generate slot pages (data dictionary)
     slots_dir = output_path / "slots"
     slots_dir.mkdir(exist_ok=True)
     
-    for slot_name, slot in local_slots.items():
-        content = render_slot_page(sv, slot_name, slot)
-        (slots_dir / f"{slot_name}.md").write_text(content)
+    def write_slot_page(item):
+        slot_name, slot = item
+        content = render_slot_page(slot_name, slot, slot_to_classes, range_kind)
+        _dump(slots_dir / f"{slot_name}.md", content)
+    
+    # Pages are independent, so overlap rendering with the small-file writes.
+    # Workers share only the slot objects and the read-only slot_to_classes and
+    # range_kind tables built above; none of them touch the SchemaView.
+    with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+        # Consume the iterator so worker exceptions propagate
+        list(executor.map(write_slot_page, local_slots.items()))
     
     # Generate class pages
     if not slots_only and local_classes:
         classes_dir = output_path / "classes"
         classes_dir.mkdir(exist_ok=True)
         for cls_name, cls in local_classes.items():
-            content = render_class_page(sv, cls_name, cls)
-            (classes_dir / f"{cls_name}.md").write_text(content)
+            content = render_class_page(sv, cls_name, cls, local_slots, local_classes)
+            _dump(classes_dir / f"{cls_name}.md", content)
     
     # Generate enum pages
     if local_enums:
@@ -63,17 +160,21 @@ def generate_filtered_docs(
         enums_dir.mkdir(exist_ok=True)
         for enum_name, enum in local_enums.items():
             content = render_enum_page(sv, enum_name, enum)
-            (enums_dir / f"{enum_name}.md").write_text(content)
+            _dump(enums_dir / f"{enum_name}.md", content)
     
     # Generate index
-    index_content = render_index(sv, local_slots, local_classes, local_enums, slots_only)
-    (output_path / "index.md").write_text(index_content)
+    index_content = render_index(
+        sv, local_slots, sorted_slot_names, sorted_class_names, sorted_enum_names,
+        slots_only
+    )
+    _dump(output_path / "index.md", index_content)
     
     # Generate complete mkdocs.yml
     mkdocs_config = generate_mkdocs_config(
-        sv.schema, local_slots, local_classes, local_enums, slots_only
+        sv.schema, sorted_slot_names, sorted_class_names, sorted_enum_names,
+        slots_only
     )
-    (output_path.parent / "mkdocs.yml").write_text(mkdocs_config)
+    _dump(output_path.parent / "mkdocs.yml", mkdocs_config)
     print(f"\nGenerated mkdocs.yml with collapsible navigation")
     
     return local_slots, local_classes, local_enums
@@ -81,234 +182,270 @@ def generate_filtered_docs(
 
 def case_insensitive_sort(names):
     """Sort names alphabetically, ignoring case."""
-    return sorted(names, key=lambda x: x.lower())
+    return sorted(names, key=str.lower)
+
+
+def _single_line(text, limit=None) -> str:
+    """Flatten a description onto one line for a markdown table cell."""
+    text = text or ""
+    # Most descriptions are one line already, so only run the regex when there
+    # is a line break (LF or CR). Single-line text, including any runs of spaces
+    # or tabs, passes through unchanged.
+    if "\n" in text or "\r" in text:
+        text = _WHITESPACE_RE.sub(" ", text)
+    return text[:limit]
 
 
-def render_slot_page(sv: SchemaView, slot_name: str, slot) -> str:
+def render_slot_page(
+    slot_name: str,
+    slot,
+    slot_to_classes: dict,
+    range_kind: dict
+) -> str:
     """Render a single slot page with full type information."""
-    lines = [f"# {slot_name}", ""]
+    # Each section starts with its leading blank line and ends with a newline
+    buf = io.StringIO()
+    buf.write(f"# {slot_name}\n")
     
     if slot.description:
-        lines.extend([slot.description, ""])
+        buf.write(f"\n{slot.description}\n")
     
     # Comments
     if slot.comments:
-        lines.extend(["## Comments", ""])
+        buf.write("\n## Comments\n\n")
         for comment in slot.comments:
-            lines.append(f"- {comment}")
-        lines.append("")
+            buf.write(f"- {comment}\n")
     
     # Basic info table
-    lines.extend([
-        "## Details",
-        "",
-        "| Property | Value |",
-        "|----------|-------|",
-    ])
+    buf.write(
+        "\n## Details\n"
+        "\n"
+        "| Property | Value |\n"
+        "|----------|-------|\n"
+    )
     
     # Range (type)
     range_val = slot.range or "string"
     range_display = range_val
+    kind, type_uri = range_kind.get(range_val, (None, None))
     
-    if range_val in sv.all_enums():
+    if kind == "enum":
         range_display = f"[{range_val}](../enums/{range_val}.md)"
-    elif range_val in sv.all_classes():
+    elif kind == "class":
         range_display = f"[{range_val}](../classes/{range_val}.md)"
-    elif range_val in sv.all_types():
-        type_obj = sv.get_type(range_val)
-        if type_obj and type_obj.uri:
-            range_display = f"`{range_val}` ({type_obj.uri})"
+    elif kind == "type":
+        if type_uri:
+            range_display = f"`{range_val}` ({type_uri})"
         else:
             range_display = f"`{range_val}`"
     
-    lines.append(f"| **Range** | {range_display} |")
-    lines.append(f"| **Required** | {'Yes' if slot.required else 'No'} |")
-    lines.append(f"| **Multivalued** | {'Yes' if slot.multivalued else 'No'} |")
+    buf.write(f"| **Range** | {range_display} |\n")
+    buf.write(f"| **Required** | {'Yes' if slot.required else 'No'} |\n")
+    buf.write(f"| **Multivalued** | {'Yes' if slot.multivalued else 'No'} |\n")
     
     if slot.pattern:
-        lines.append(f"| **Pattern** | `{slot.pattern}` |")
+        buf.write(f"| **Pattern** | `{slot.pattern}` |\n")
     
     if slot.minimum_value is not None:
-        lines.append(f"| **Minimum** | {slot.minimum_value} |")
+        buf.write(f"| **Minimum** | {slot.minimum_value} |\n")
     
     if slot.maximum_value is not None:
-        lines.append(f"| **Maximum** | {slot.maximum_value} |")
+        buf.write(f"| **Maximum** | {slot.maximum_value} |\n")
     
     if slot.unit:
         unit_info = slot.unit
-        if hasattr(unit_info, 'symbol'):
-            lines.append(f"| **Unit** | {unit_info.symbol} ({getattr(unit_info, 'ucum_code', '')}) |")
+        symbol = getattr(unit_info, 'symbol', _MISSING)
+        if symbol is not _MISSING:
+            buf.write(f"| **Unit** | {symbol} ({getattr(unit_info, 'ucum_code', '')}) |\n")
         else:
-            lines.append(f"| **Unit** | {unit_info} |")
+            buf.write(f"| **Unit** | {unit_info} |\n")
     
     if slot.in_subset:
         subsets = ", ".join(slot.in_subset)
-        lines.append(f"| **Subsets** | {subsets} |")
-    
-    lines.append("")
+        buf.write(f"| **Subsets** | {subsets} |\n")
     
     # Annotations
     if slot.annotations:
-        lines.extend(["## Annotations", ""])
-        lines.extend([
-            "| Tag | Value |",
-            "|-----|-------|",
-        ])
+        buf.write(
+            "\n## Annotations\n"
+            "\n"
+            "| Tag | Value |\n"
+            "|-----|-------|\n"
+        )
         for ann_name, ann in slot.annotations.items():
             # Handle both simple values and annotation objects
-            if hasattr(ann, 'value'):
-                ann_value = ann.value
-            else:
+            ann_value = getattr(ann, 'value', _MISSING)
+            if ann_value is _MISSING:
                 ann_value = str(ann)
-            lines.append(f"| `{ann_name}` | {ann_value} |")
-        lines.append("")
+            buf.write(f"| `{ann_name}` | {ann_value} |\n")
     
     # Examples
     if slot.examples:
-        lines.extend(["## Examples", ""])
+        buf.write("\n## Examples\n\n")
         for ex in slot.examples:
-            if hasattr(ex, 'value'):
-                lines.append(f"- `{ex.value}`")
-            else:
-                lines.append(f"- `{ex}`")
-        lines.append("")
+            ex_value = getattr(ex, 'value', _MISSING)
+            if ex_value is _MISSING:
+                ex_value = ex
+            buf.write(f"- `{ex_value}`\n")
     
     # Used in classes
-    classes_using = [
-        cls_name for cls_name, cls in sv.all_classes().items()
-        if slot_name in sv.class_slots(cls_name)
-    ]
+    classes_using = slot_to_classes.get(slot_name, [])
     if classes_using:
-        lines.extend(["## Used In", ""])
-        for cls_name in case_insensitive_sort(classes_using):
-            lines.append(f"- [{cls_name}](../classes/{cls_name}.md)")
-        lines.append("")
+        buf.write("\n## Used In\n\n")
+        for cls_name in classes_using:
+            buf.write(f"- [{cls_name}](../classes/{cls_name}.md)\n")
     
     # Slot inheritance
     if slot.is_a:
-        lines.extend([
-            "## Inheritance",
-            "",
-            f"Inherits from: `{slot.is_a}`",
-            ""
-        ])
+        buf.write(f"\n## Inheritance\n\nInherits from: `{slot.is_a}`\n")
     
     # Mixins
     if slot.mixins:
-        lines.extend(["## Mixins", ""])
+        buf.write("\n## Mixins\n\n")
         for mixin in slot.mixins:
-            lines.append(f"- `{mixin}`")
-        lines.append("")
+            buf.write(f"- `{mixin}`\n")
     
-    return "\n".join(lines)
+    return buf.getvalue()
+
+
+def _class_slot_names(sv: "SchemaView", cls_name: str, cls) -> list:
+    """
+    Slots documented on a class page: those asserted directly on the class plus
+    any inherited slots the class refines through its own slot_usage.
+    """
+    names = list(sv.class_slots(cls_name, direct=True))
+    seen = set(names)
+    names.extend(name for name in (cls.slot_usage or {}) if name not in seen)
+    return names
+
+
+def _class_ref(name: str, local_classes) -> str:
+    """Link a class name to its page, or show it as code if it has no page."""
+    if name in local_classes:
+        return f"[{name}]({name}.md)"
+    return f"`{name}`"
+
 
+def _refined(slot, usage, attr):
+    """Return a slot attribute, preferring the class's slot_usage value if set."""
+    value = getattr(usage, attr, None)
+    return getattr(slot, attr, None) if value is None else value
 
-def render_class_page(sv: SchemaView, cls_name: str, cls) -> str:
-    """Render a class page."""
-    lines = [f"# {cls_name}", ""]
+
+def render_class_page(
+    sv: "SchemaView", cls_name: str, cls, local_slots: dict, local_classes: dict
+) -> str:
+    """Render a class page listing the slots asserted or refined on the class."""
+    buf = io.StringIO()
+    buf.write(f"# {cls_name}\n")
     
     if cls.description:
-        lines.extend([cls.description, ""])
-    
-    # Attributes table
-    slots = sv.class_induced_slots(cls_name)
-    if slots:
-        lines.extend([
-            "## Attributes",
-            "",
-            "| Name | Type | Description | Required |",
-            "|------|------|-------------|----------|",
-        ])
-        # Sort slots alphabetically by name, case-insensitive
-        sorted_slots = sorted(slots, key=lambda s: s.name.lower())
-        for slot in sorted_slots:
-            slot_link = f"[{slot.name}](../slots/{slot.name}.md)"
-            range_val = slot.range or "string"
-            desc = (slot.description or "").replace("\n", " ")[:100]
-            req = "Yes" if slot.required else "No"
-            lines.append(f"| {slot_link} | `{range_val}` | {desc} | {req} |")
-        lines.append("")
+        buf.write(f"\n{cls.description}\n")
+    
+    # Attributes table, sorted alphabetically by name, case-insensitive.
+    # Class attributes take precedence over schema-level slots of the same name,
+    # and the class's own slot_usage refines the columns shown in the table.
+    attributes = cls.attributes or {}
+    slot_usage = cls.slot_usage or {}
+    rows = []
+    for name in case_insensitive_sort(_class_slot_names(sv, cls_name, cls)):
+        slot = attributes.get(name) or local_slots.get(name) or sv.get_slot(name)
+        usage = slot_usage.get(name)
+        rows.append((
+            name,
+            _refined(slot, usage, 'range') or "string",
+            _single_line(_refined(slot, usage, 'description'), 100),
+            "Yes" if _refined(slot, usage, 'required') else "No",
+        ))
+    if rows:
+        buf.write(
+            "\n## Attributes\n"
+            "\n"
+            "| Name | Type | Description | Required |\n"
+            "|------|------|-------------|----------|\n"
+        )
+        row = "| [{0}](../slots/{0}.md) | `{1}` | {2} | {3} |\n".format
+        buf.writelines(row(*values) for values in rows)
     
     if cls.is_a:
-        lines.extend([
-            "## Inheritance",
-            "",
-            f"Inherits from: `{cls.is_a}`",
-            ""
-        ])
-    
-    return "\n".join(lines)
+        parent_ref = _class_ref(cls.is_a, local_classes)
+        buf.write(
+            f"\n## Inheritance\n\nInherits from: `{cls.is_a}`\n"
+            f"\nOther inherited slots are listed on the {parent_ref} page.\n"
+        )
+    
+    if cls.mixins:
+        buf.write("\n## Mixins\n\n")
+        for mixin in cls.mixins:
+            mixin_ref = _class_ref(mixin, local_classes)
+            buf.write(f"- `{mixin}`: slots are listed on the {mixin_ref} page\n")
+    
+    return buf.getvalue()
 
 
-def render_enum_page(sv: SchemaView, enum_name: str, enum) -> str:
+def render_enum_page(sv: "SchemaView", enum_name: str, enum) -> str:
     """Render an enum page."""
-    lines = [f"# {enum_name}", ""]
+    buf = io.StringIO()
+    buf.write(f"# {enum_name}\n")
     
     if enum.description:
-        lines.extend([enum.description, ""])
+        buf.write(f"\n{enum.description}\n")
     
-    lines.extend([
-        "## Permitted Values",
-        "",
-        "| Value | Description |",
-        "|-------|-------------|",
-    ])
+    buf.write(
+        "\n## Permitted Values\n"
+        "\n"
+        "| Value | Description |\n"
+        "|-------|-------------|\n"
+    )
     
     if enum.permissible_values:
         # Sort permissible values alphabetically, case-insensitive
         sorted_pvs = case_insensitive_sort(enum.permissible_values.keys())
         for pv_name in sorted_pvs:
             pv = enum.permissible_values[pv_name]
-            desc = ""
-            if pv and hasattr(pv, 'description') and pv.description:
-                desc = pv.description.replace("\n", " ")
-            lines.append(f"| `{pv_name}` | {desc} |")
+            desc = _single_line(getattr(pv, 'description', None))
+            buf.write(f"| `{pv_name}` | {desc} |\n")
     
-    lines.append("")
-    return "\n".join(lines)
+    return buf.getvalue()
 
 
-def render_index(sv, local_slots, local_classes, local_enums, slots_only) -> str:
-    """Render the index page."""
+def render_index(
+    sv, local_slots, sorted_slot_names, sorted_class_names, sorted_enum_names, slots_only
+) -> str:
+    """Render the index page from the pre-sorted element names."""
     schema = sv.schema
     display_name = schema.title or schema.name or "Schema"
-    lines = [
-        f"# {display_name}",
-        "",
-    ]
+    buf = io.StringIO()
+    buf.write(f"# {display_name}\n")
     
     if schema.description:
-        lines.extend([schema.description, ""])
+        buf.write(f"\n{schema.description}\n")
     
     # Slots section (data dictionary)
-    lines.extend([
-        "## Data Dictionary",
-        "",
-        "| Field | Type | Description |",
-        "|-------|------|-------------|",
-    ])
-    
-    for slot_name in case_insensitive_sort(local_slots.keys()):
+    buf.write(
+        "\n## Data Dictionary\n"
+        "\n"
+        "| Field | Type | Description |\n"
+        "|-------|------|-------------|\n"
+    )
+    
+    for slot_name in sorted_slot_names:
         slot = local_slots[slot_name]
         range_val = slot.range or "string"
-        desc = (slot.description or "").replace("\n", " ")[:80]
-        lines.append(f"| [{slot_name}](slots/{slot_name}.md) | `{range_val}` | {desc} |")
+        desc = _single_line(slot.description, 80)
+        buf.write(f"| [{slot_name}](slots/{slot_name}.md) | `{range_val}` | {desc} |\n")
     
-    lines.append("")
+    if not slots_only and sorted_class_names:
+        buf.write("\n## Classes\n\n")
+        for cls_name in sorted_class_names:
+            buf.write(f"- [{cls_name}](classes/{cls_name}.md)\n")
     
-    if not slots_only and local_classes:
-        lines.extend(["## Classes", ""])
-        for cls_name in case_insensitive_sort(local_classes.keys()):
-            lines.append(f"- [{cls_name}](classes/{cls_name}.md)")
-        lines.append("")
+    if sorted_enum_names:
+        buf.write("\n## Enumerations\n\n")
+        for enum_name in sorted_enum_names:
+            buf.write(f"- [{enum_name}](enums/{enum_name}.md)\n")
     
-    if local_enums:
-        lines.extend(["## Enumerations", ""])
-        for enum_name in case_insensitive_sort(local_enums.keys()):
-            lines.append(f"- [{enum_name}](enums/{enum_name}.md)")
-        lines.append("")
-    
-    return "\n".join(lines)
+    return buf.getvalue()
 
 def create_custom_css(output_dir: str):
     """Create custom CSS to fix sidebar scrolling."""
@@ -335,32 +472,29 @@ def create_custom_css(output_dir: str):
   flex-grow: 1;
 }
 """
-    (css_dir / "custom.css").write_text(css_content)
+    _dump(css_dir / "custom.css", css_content)
 
-def generate_mkdocs_config(schema, local_slots, local_classes, local_enums, slots_only) -> str:
+def generate_mkdocs_config(
+    schema, sorted_slot_names, sorted_class_names, sorted_enum_names, slots_only
+) -> str:
     """Generate a complete mkdocs.yml with collapsible, alphabetized navigation."""
     
-    nav_lines = []
-    nav_lines.append("  - Home: index.md")
+    # Entry blocks for the nav; optional sections carry their own header so
+    # they drop out of the template entirely when empty
+    classes_block = ""
+    if not slots_only and sorted_class_names:
+        classes_block = "\n  - Classes:" + "".join(
+            f"\n      - {n}: classes/{n}.md" for n in sorted_class_names
+        )
     
-    # Classes first
-    if not slots_only and local_classes:
-        nav_lines.append("  - Classes:")
-        for cls_name in case_insensitive_sort(local_classes.keys()):
-            nav_lines.append(f"      - {cls_name}: classes/{cls_name}.md")
-    
-    # Enums second
-    if local_enums:
-        nav_lines.append("  - Enumerations:")
-        for enum_name in case_insensitive_sort(local_enums.keys()):
-            nav_lines.append(f"      - {enum_name}: enums/{enum_name}.md")
+    enums_block = ""
+    if sorted_enum_names:
+        enums_block = "\n  - Enumerations:" + "".join(
+            f"\n      - {n}: enums/{n}.md" for n in sorted_enum_names
+        )
     
-    # Data Dictionary last
-    nav_lines.append("  - Data Dictionary:")
-    for slot_name in case_insensitive_sort(local_slots.keys()):
-        nav_lines.append(f"      - {slot_name}: slots/{slot_name}.md")
+    dd_block = "".join(f"\n      - {n}: slots/{n}.md" for n in sorted_slot_names)
     
-    nav_yaml = "\n".join(nav_lines)
     schema_name = schema.title or schema.name or "Schema"
     
     config = f"""site_name: {schema_name}
@@ -386,7 +520,8 @@ markdown_extensions:
       permalink: true
 
 nav:
-{nav_yaml}
+  - Home: index.md{classes_block}{enums_block}
+  - Data Dictionary:{dd_block}
 """
     return config
     